@@ -17,20 +17,16 @@
 # along with BlenderBIM Add-on.  If not, see <http://www.gnu.org/licenses/>.
 
 import bpy
-import ifcopenshell.api
-import ifcopenshell.util.element
 import blenderbim.tool as tool
 import blenderbim.core.spatial as core
-import blenderbim.core.root
 import blenderbim.bim.handler
 from blenderbim.bim.ifc import IfcStore
-from blenderbim.bim.module.spatial.data import SpatialData
 
 
 class Operator:
     def execute(self, context):
+        # UI data is refreshed by execute_ifc_operator once the outermost IFC operator finishes
         IfcStore.execute_ifc_operator(self, context)
-        blenderbim.bim.handler.refresh_ui_data()
         return {"FINISHED"}
 
 
@@ -100,8 +96,7 @@ class CopyToContainer(bpy.types.Operator, Operator):
     def _execute(self, context):
         sprops = context.scene.BIMSpatialProperties
         containers = [tool.Ifc.get().by_id(c.ifc_definition_id) for c in sprops.containers if c.is_selected]
-        for obj in context.selected_objects:
-            core.copy_to_container(tool.Ifc, tool.Spatial, obj=obj, containers=containers)
+        core.copy_to_container_batch(tool.Ifc, tool.Spatial, objs=list(context.selected_objects), containers=containers)
         blenderbim.bim.handler.purge_module_data()
 
 
@@ -51,21 +51,26 @@ def remove_container(ifc, collector, obj=None):
 
 
 def copy_to_container(ifc, spatial, obj=None, containers=None):
-    element = ifc.get_entity(obj)
-    if not element:
-        return
-    from_container = spatial.get_container(element)
-    if from_container:
-        matrix = spatial.get_relative_object_matrix(obj, ifc.get_object(from_container))
-    else:
-        matrix = spatial.get_object_matrix(obj)
-    for to_container in containers:
-        to_container_obj = ifc.get_object(to_container)
-        copied_obj = spatial.duplicate_object_and_data(obj)
-        spatial.set_relative_object_matrix(copied_obj, to_container_obj, matrix)
-        spatial.run_root_copy_class(obj=copied_obj)
-        spatial.run_spatial_assign_container(structure_obj=to_container_obj, element_obj=copied_obj)
-    spatial.disable_editing(obj)
+    copy_to_container_batch(ifc, spatial, objs=[obj], containers=containers)
+
+
+def copy_to_container_batch(ifc, spatial, objs=None, containers=None):
+    container_objs = [ifc.get_object(c) for c in containers]
+    for obj in objs:
+        element = ifc.get_entity(obj)
+        if not element:
+            continue
+        from_container = spatial.get_container(element)
+        if from_container:
+            matrix = spatial.get_relative_object_matrix(obj, ifc.get_object(from_container))
+        else:
+            matrix = spatial.get_object_matrix(obj)
+        for to_container_obj in container_objs:
+            copied_obj = spatial.duplicate_object_and_data(obj)
+            spatial.set_relative_object_matrix(copied_obj, to_container_obj, matrix)
+            spatial.run_root_copy_class(obj=copied_obj)
+            spatial.run_spatial_assign_container(structure_obj=to_container_obj, element_obj=copied_obj)
+        spatial.disable_editing(obj)
 
 
 def select_container(ifc, spatial, obj=None):
@@ -96,6 +96,40 @@ class TestCopyToContainer:
         subject.copy_to_container(ifc, spatial, obj="obj", containers=["to_container"])
 
 
+class TestCopyToContainerBatch:
+    def test_run(self, ifc, spatial):
+        ifc.get_object("to_container").should_be_called(1).will_return("to_container_obj")
+
+        ifc.get_entity("obj1").should_be_called().will_return("element1")
+        spatial.get_container("element1").should_be_called().will_return(None)
+        spatial.get_object_matrix("obj1").should_be_called().will_return("matrix1")
+        spatial.duplicate_object_and_data("obj1").should_be_called().will_return("new_obj1")
+        spatial.set_relative_object_matrix("new_obj1", "to_container_obj", "matrix1").should_be_called()
+        spatial.run_root_copy_class(obj="new_obj1").should_be_called()
+        spatial.run_spatial_assign_container(
+            structure_obj="to_container_obj", element_obj="new_obj1"
+        ).should_be_called()
+        spatial.disable_editing("obj1").should_be_called()
+
+        ifc.get_entity("obj2").should_be_called().will_return("element2")
+        spatial.get_container("element2").should_be_called().will_return(None)
+        spatial.get_object_matrix("obj2").should_be_called().will_return("matrix2")
+        spatial.duplicate_object_and_data("obj2").should_be_called().will_return("new_obj2")
+        spatial.set_relative_object_matrix("new_obj2", "to_container_obj", "matrix2").should_be_called()
+        spatial.run_root_copy_class(obj="new_obj2").should_be_called()
+        spatial.run_spatial_assign_container(
+            structure_obj="to_container_obj", element_obj="new_obj2"
+        ).should_be_called()
+        spatial.disable_editing("obj2").should_be_called()
+
+        subject.copy_to_container_batch(ifc, spatial, objs=["obj1", "obj2"], containers=["to_container"])
+
+    def test_skipping_objects_which_are_not_ifc_elements(self, ifc, spatial):
+        ifc.get_object("to_container").should_be_called().will_return("to_container_obj")
+        ifc.get_entity("obj").should_be_called().will_return(None)
+        subject.copy_to_container_batch(ifc, spatial, objs=["obj"], containers=["to_container"])
+
+
 class TestSelectContainer:
     def test_run(self, ifc, spatial):
         ifc.get_entity("obj").should_be_called().will_return("element")
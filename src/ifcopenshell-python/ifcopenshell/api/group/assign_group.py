@@ -42,8 +42,12 @@ class Usecase:
                 }
             )
         rel = self.settings["group"].IsGroupedBy[0]
-        related_objects = set(rel.RelatedObjects) or set()
+        existing_objects = rel.RelatedObjects or ()
+        # Merge by id to preserve the existing order of related objects
+        related_objects = {e.id(): e for e in existing_objects}
         for obj in self.settings["product"]:
-            related_objects.add(obj)
-        rel.RelatedObjects = list(related_objects)
+            related_objects.setdefault(obj.id(), obj)
+        if len(related_objects) == len(existing_objects):
+            return
+        rel.RelatedObjects = list(related_objects.values())
         ifcopenshell.api.run("owner.update_owner_history", self.file, **{"element": rel})
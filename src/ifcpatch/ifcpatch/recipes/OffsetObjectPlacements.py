@@ -29,54 +29,67 @@ class Patcher:
         self.args = args
 
     def patch(self):
-        absolute_placements = []
+        x, y, z, angle = map(float, self.args[0:4])
+        if not x and not y and not z and not angle:
+            return
 
-        for product in self.file.by_type('IfcProduct'):
-            if not product.ObjectPlacement:
-                continue
-            absolute_placement = self.get_absolute_placement(product.ObjectPlacement)
-            if absolute_placement.is_a('IfcLocalPlacement'):
-                absolute_placements.append(absolute_placement)
-        absolute_placements = set(absolute_placements)
+        absolute_placements = [p for p in self.file.by_type("IfcLocalPlacement") if p.PlacementRelTo is None]
 
-        angle = float(self.args[3])
-        transformation = self.z_rotation_matrix(math.radians(angle)) if angle else np.eye(4)
-        transformation[0][3] += float(self.args[0])
-        transformation[1][3] += float(self.args[1])
-        transformation[2][3] += float(self.args[2])
+        if not absolute_placements:
+            return
 
-        for placement in absolute_placements:
-            placement.RelativePlacement = self.get_relative_placement(
-                transformation @ ifcopenshell.util.placement.get_local_placement(placement)
-            )
+        if not angle:
+            # Without a rotation the axes stay the same, so only the location needs to change
+            remaining_placements = []
+            for placement in absolute_placements:
+                if placement.RelativePlacement.is_a("IfcAxis2Placement3D"):
+                    placement.RelativePlacement = self.get_translated_placement(placement.RelativePlacement, x, y, z)
+                else:
+                    remaining_placements.append(placement)
+            absolute_placements = remaining_placements
+            if not absolute_placements:
+                return
 
-    def get_absolute_placement(self, object_placement):
-        if object_placement.PlacementRelTo:
-            return self.get_absolute_placement(object_placement.PlacementRelTo)
-        return object_placement
+        transformation = self.z_rotation_matrix(math.radians(angle))
+        transformation[0][3] += x
+        transformation[1][3] += y
+        transformation[2][3] += z
+
+        # Transform all placements in one go rather than one matmul per placement
+        matrices = transformation @ np.stack(
+            [ifcopenshell.util.placement.get_local_placement(p) for p in absolute_placements]
+        )
+
+        for placement, matrix in zip(absolute_placements, matrices):
+            placement.RelativePlacement = self.get_relative_placement(matrix)
+
+    def get_translated_placement(self, relative_placement, x, y, z):
+        coordinates = relative_placement.Location.Coordinates
+        return self.file.createIfcAxis2Placement3D(
+            self.file.createIfcCartesianPoint((coordinates[0] + x, coordinates[1] + y, coordinates[2] + z)),
+            relative_placement.Axis,
+            relative_placement.RefDirection,
+        )
 
     def z_rotation_matrix(self, angle):
-        return [
-            [math.cos(angle), -math.sin(angle), 0., 0.],
-            [math.sin(angle), math.cos(angle), 0., 0.],
-            [0., 0., 1., 0.],
-            [0., 0., 0., 1.],
-        ]
+        c, s = math.cos(angle), math.sin(angle)
+        matrix = np.eye(4)
+        matrix[0][0], matrix[0][1] = c, -s
+        matrix[1][0], matrix[1][1] = s, c
+        return matrix
 
     def get_relative_placement(self, m):
         x = np.array((m[0][0], m[1][0], m[2][0]))
         z = np.array((m[0][2], m[1][2], m[2][2]))
         o = np.array((m[0][3], m[1][3], m[2][3]))
         object_matrix = ifcopenshell.util.placement.a2p(o, z, x)
-        return self.create_ifc_axis_2_placement_3d(
-            object_matrix[:, 3][0:3],
-            object_matrix[:, 2][0:3],
-            object_matrix[:, 0][0:3],
-        )
+        # Gather the origin, Z and X columns into one array so they are converted to Python lists in a single pass
+        point, up, forward = object_matrix[0:3, (3, 2, 0)].T.tolist()
+        return self.create_ifc_axis_2_placement_3d(point, up, forward)
 
     def create_ifc_axis_2_placement_3d(self, point, up, forward):
         return self.file.createIfcAxis2Placement3D(
-            self.file.createIfcCartesianPoint(point.tolist()),
-            self.file.createIfcDirection(up.tolist()),
-            self.file.createIfcDirection(forward.tolist()),
+            self.file.createIfcCartesianPoint(point),
+            self.file.createIfcDirection(up),
+            self.file.createIfcDirection(forward),
         )
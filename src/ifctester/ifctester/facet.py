@@ -41,6 +41,9 @@ def cast_to_value(from_value, to_value):
 
 
 class Facet:
+    # Whether filter() fully applies the facet, so filtered elements need not be checked again
+    filter_is_complete = True
+
     def __init__(self, *parameters):
         self.status = None
         self.failed_entities = []
@@ -71,6 +74,11 @@ class Facet:
     def filter(self, ifc_file, elements):
         return [e for e in elements if self(e)]
 
+    def reset_status(self):
+        self.status = None
+        self.failed_entities = []
+        self.failed_reasons = []
+
     def to_string(self, clause_type):
         if clause_type == "applicability":
             templates = self.applicability_templates
@@ -119,13 +127,18 @@ class Entity(Facet):
         ]
         super().__init__(name, predefinedType, instructions)
 
-    def filter(self, ifc_file, elements):
+    def filter(self, ifc_file, elements, type_index=None):
         if isinstance(self.name, str):
-            results = ifc_file.by_type(self.name, include_subtypes=False)
+            if type_index is None:
+                results = ifc_file.by_type(self.name, include_subtypes=False)
+            else:
+                results = type_index.get(self.name)
+                if results is None:
+                    results = type_index[self.name] = ifc_file.by_type(self.name, include_subtypes=False)
         else:
             results = []
             ifc_classes = [t for t in ifc_file.wrapped_data.types() if t.upper() == self.name]
-            [results.append(ifc_file.by_type(ifc_class, include_subtypes=False)) for ifc_class in ifc_classes]
+            [results.extend(ifc_file.by_type(ifc_class, include_subtypes=False)) for ifc_class in ifc_classes]
         if self.predefinedType:
             return [r for r in results if self(r)]
         return results
@@ -243,6 +256,8 @@ class Attribute(Facet):
 
 
 class Classification(Facet):
+    filter_is_complete = False
+
     def __init__(self, value=None, system=None, uri=None, minOccurs=None, maxOccurs=None, instructions=None):
         self.parameters = ["value", "system", "@uri", "@minOccurs", "@maxOccurs", "@instructions"]
         self.applicability_templates = [
@@ -258,7 +273,7 @@ class Classification(Facet):
         super().__init__(value, system, uri, minOccurs, maxOccurs, instructions)
 
     def filter(self, ifc_file, elements):
-        pass
+        return elements
 
     def __call__(self, inst, logger=None):
         leaf_references = ifcopenshell.util.classification.get_references(inst)
@@ -470,6 +485,7 @@ class Material(Facet):
 
 class Restriction:
     def __init__(self, options="", type="pattern", base="string"):
+        self.reset_cache()
         if type in ["enumeration", "pattern", "bounds"]:
             self.type = type
             self.base = base
@@ -484,6 +500,7 @@ class Restriction:
                 raise Exception("Options were not properly defined.")
 
     def parse(self, ids_dict):
+        self.reset_cache()
         if ids_dict:
             try:
                 self.base = ids_dict["@base"][3:]
@@ -521,6 +538,11 @@ class Restriction:
                     print("Error! Restriction not implemented")
         return self
 
+    def reset_cache(self):
+        # Compiled patterns and enumeration sets are built on first comparison and reused for every element after
+        self.compiled_pattern = None
+        self.enumeration_values = None
+
     def asdict(self):
         rest_dict = {"@base": "xs:" + self.base}
         if self.type == "enumeration":
@@ -543,8 +565,13 @@ class Restriction:
         result = False
         if self and (other or other == 0):
             if self.type == "enumeration" and self.base == "bool":
-                self.options = [x.lower() for x in self.options]
-                result = str(other).lower() in self.options
+                if self.enumeration_values is None:
+                    self.enumeration_values = frozenset(x.lower() for x in self.options)
+                result = str(other).lower() in self.enumeration_values
+            elif self.type == "enumeration" and isinstance(other, str):
+                if self.enumeration_values is None:
+                    self.enumeration_values = frozenset(str(o) for o in self.options)
+                result = other in self.enumeration_values
             elif self.type == "enumeration":
                 result = other in [cast_to_value(o, other) for o in self.options]
             elif self.type == "bounds":
@@ -563,13 +590,14 @@ class Restriction:
                     if eval(str(len(other)) + op):  # TODO eval not safe?
                         result = True
             elif self.type == "pattern":
-                if isinstance(self.options, list):
-                    # TODO handle case with multiple pattern options
-                    translated_pattern = identities.translate_pattern(self.options[0])
-                else:
-                    translated_pattern = identities.translate_pattern(self.options)
-                regex_pattern = re.compile(translated_pattern)
-                if regex_pattern.fullmatch(other) is not None:
+                if self.compiled_pattern is None:
+                    if isinstance(self.options, list):
+                        # TODO handle case with multiple pattern options
+                        translated_pattern = identities.translate_pattern(self.options[0])
+                    else:
+                        translated_pattern = identities.translate_pattern(self.options)
+                    self.compiled_pattern = re.compile(translated_pattern)
+                if self.compiled_pattern.fullmatch(other) is not None:
                     result = True
             # TODO add fractionDigits
             # TODO add totalDigits
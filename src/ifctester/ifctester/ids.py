@@ -20,13 +20,22 @@ import os
 import datetime
 from xmlschema import XMLSchema
 from xmlschema import etree_tostring
-from xml.etree import ElementTree as ET
+from lxml import etree
 from .facet import Entity, Attribute, Classification, Property, PartOf, Material, Restriction
 
 
 cwd = os.path.dirname(os.path.realpath(__file__))
 schema = None
 
+FACET_CLASSES = {
+    "entity": Entity,
+    "attribute": Attribute,
+    "classification": Classification,
+    "partOf": PartOf,
+    "property": Property,
+    "material": Material,
+}
+
 
 def open(filepath, validate=False):
     if validate:
@@ -110,14 +119,25 @@ class Ids:
         return etree_tostring(get_schema().encode(self.asdict()), namespaces=ns)
 
     def to_xml(self, filepath="output.xml"):
-        ET.register_namespace("", "http://standards.buildingsmart.org/IDS")
-        ET.ElementTree(get_schema().encode(self.asdict())).write(filepath, encoding="utf-8", xml_declaration=True)
+        ns = {
+            "": "http://standards.buildingsmart.org/IDS",
+            "xs": "http://www.w3.org/2001/XMLSchema",
+            "xsi": "http://www.w3.org/2001/XMLSchema-instance",
+        }
+        element = get_schema().encode(self.asdict(), namespaces=ns, etree_element_class=etree.Element)
+        etree.ElementTree(element).write(filepath, encoding="utf-8", xml_declaration=True, pretty_print=False)
         return get_schema().is_valid(filepath)
 
     def validate(self, ifc_file):
+        # Specifications commonly share entity facets, so entities are only queried once per class
+        type_index = {}
         for specification in self.specifications:
-            specification.reset_status()
-            specification.validate(ifc_file)
+            if ifc_file.schema in specification.ifcVersion:
+                specification.reset_status()
+                specification.validate(ifc_file, type_index=type_index)
+            elif specification.status is not None:
+                # Only clear results left behind from validating a previous file
+                specification.reset_status()
 
 
 class Specification:
@@ -136,18 +156,19 @@ class Specification:
         self.requirements = []
         self.minOccurs = minOccurs
         self.maxOccurs = maxOccurs
-        self.ifcVersion = ifcVersion
+        self.ifcVersion = self.parse_ifc_version(ifcVersion)
         self.identifier = identifier
         self.description = description
         self.instructions = instructions
 
         self.applicable_entities = []
+        self.failed_entities = set()
         self.status = None
 
     def asdict(self):
         results = {
             "@name": self.name,
-            "@ifcVersion": self.ifcVersion,
+            "@ifcVersion": sorted(self.ifcVersion),
             "applicability": {},
             "requirements": {},
         }
@@ -172,43 +193,57 @@ class Specification:
         self.name = ids_dict.get("@name", "")
         self.minOccurs = ids_dict["@minOccurs"]
         self.maxOccurs = ids_dict["@maxOccurs"]
-        self.ifcVersion = ids_dict["@ifcVersion"]
+        self.ifcVersion = self.parse_ifc_version(ids_dict["@ifcVersion"])
         self.applicability = self.parse_clause(ids_dict["applicability"])
         self.requirements = self.parse_clause(ids_dict["requirements"])
         return self
 
+    def parse_ifc_version(self, ifc_version):
+        if isinstance(ifc_version, str):
+            ifc_version = ifc_version.split()
+        return frozenset(ifc_version)
+
     def parse_clause(self, clause):
         results = []
         for name, facets in clause.items():
-            if name not in ["entity", "attribute", "classification", "partOf", "property", "material"]:
+            facet_class = FACET_CLASSES.get(name)
+            if facet_class is None:
                 continue
-            if not isinstance(facets, list):
-                facets = [facets]
+            facets = facets if isinstance(facets, list) else [facets]
             for facet_xml in facets:
-                facet = globals()[name.capitalize()]().parse(facet_xml)
-                results.append(facet)
+                results.append(facet_class().parse(facet_xml))
         return results
 
     def reset_status(self):
-        self.applicable_entities.clear()
+        self.applicable_entities = []
         self.failed_entities = set()
         for facet in self.requirements:
-            facet.failed_entities.clear()
+            facet.reset_status()
         self.status = None
 
-    def validate(self, ifc_file):
+    def validate(self, ifc_file, type_index=None):
         if ifc_file.schema not in self.ifcVersion:
             return
 
         elements = []
-        for facet in self.applicability:
-            elements = facet.filter(ifc_file, elements)
+        last_entity_index = -1
+        for i, facet in enumerate(self.applicability):
+            if isinstance(facet, Entity):
+                elements = facet.filter(ifc_file, elements, type_index=type_index)
+                last_entity_index = i
+            else:
+                elements = facet.filter(ifc_file, elements)
+
+        # Entity filters start again from the whole file, so only complete filters after the last one still hold
+        unfiltered_facets = [
+            facet
+            for i, facet in enumerate(self.applicability)
+            if i < last_entity_index or (i > last_entity_index and not facet.filter_is_complete)
+        ]
 
         for element in elements:
             is_applicable = True
-            for facet in self.applicability:
-                if isinstance(facet, Entity):
-                    continue
+            for facet in unfiltered_facets:
                 if not bool(facet(element)):
                     is_applicable = False
                     break
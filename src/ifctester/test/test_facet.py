@@ -216,6 +216,16 @@ class TestEntity:
         wall3 = ifcopenshell.api.run("root.create_entity", ifc, ifc_class="IfcWall", predefined_type="BAZFOO")
         run("Restrictions an be specified for the predefined type 3/3", facet=facet, inst=wall3, expected=False)
 
+    def test_filtering_entities_using_a_shared_type_index(self):
+        ifc = ifcopenshell.file()
+        wall = ifc.createIfcWall()
+        ifc.createIfcSlab()
+        type_index = {}
+        facet = Entity(name="IFCWALL")
+        assert list(facet.filter(ifc, [], type_index=type_index)) == [wall]
+        assert list(type_index.keys()) == ["IFCWALL"]
+        assert list(Entity(name="IFCWALL").filter(ifc, [], type_index=type_index)) == [wall]
+
 
 class TestAttribute:
     def test_creating_an_attribute_facet(self):
@@ -17,10 +17,20 @@
 # along with IfcTester.  If not, see <http://www.gnu.org/licenses/>.
 
 import os
+import re
 import pytest
 import xmlschema
 import ifcopenshell
-from ifctester import ids
+from ifctester import ids, reporter
+
+
+def get_minimal_ids():
+    specs = ids.Ids(title="Title")
+    spec = ids.Specification(name="Name")
+    spec.applicability.append(ids.Entity(name="IFCWALL"))
+    spec.requirements.append(ids.Attribute(name="Name", value="Waldo"))
+    specs.specifications.append(spec)
+    return specs
 
 
 class TestIds:
@@ -28,6 +38,27 @@ class TestIds:
         with pytest.raises(xmlschema.validators.exceptions.XMLSchemaValidationError):
             ids.open("""<?xml version="1.0" encoding="UTF-8"?><clearly_not_an_ids/>""")
 
+    def test_opening_an_ids_round_tripped_through_a_string(self):
+        specs = get_minimal_ids()
+        result = ids.open(specs.to_string())
+        assert result.info["title"] == "Title"
+        assert len(result.specifications) == 1
+
+    def test_failing_on_opening_an_ids_without_specifications(self):
+        data = re.sub(r"<specifications>.*</specifications>", "", get_minimal_ids().to_string(), flags=re.S)
+        with pytest.raises(xmlschema.validators.exceptions.XMLSchemaValidationError):
+            ids.open(data)
+
+    def test_failing_on_opening_an_ids_with_unknown_elements(self):
+        data = get_minimal_ids().to_string().replace("</specifications>", "</specifications><bogus/>")
+        with pytest.raises(xmlschema.validators.exceptions.XMLSchemaValidationError):
+            ids.open(data)
+
+    def test_failing_on_opening_an_ids_without_info(self):
+        data = re.sub(r"<info>.*</info>", "", get_minimal_ids().to_string(), flags=re.S)
+        with pytest.raises(xmlschema.validators.exceptions.XMLSchemaValidationError):
+            ids.open(data)
+
     def test_create_an_ids_with_minimal_information(self):
         specs = ids.Ids()
         assert specs.asdict() == {
@@ -134,6 +165,71 @@ class TestIds:
         assert spec.requirements[0].failed_entities == [wall]
         assert spec2.requirements[0].failed_entities == [wall]
 
+    def test_validating_with_multiple_applicability_facets(self):
+        specs = ids.Ids(title="Title")
+        spec = ids.Specification(name="Name")
+        spec.applicability.append(ids.Entity(name="IFCWALL"))
+        spec.applicability.append(ids.Attribute(name="Name", value="Waldo"))
+        spec.requirements.append(ids.Attribute(name="Description", value="Foobar"))
+        specs.specifications.append(spec)
+
+        model = ifcopenshell.file()
+        model.createIfcWall()
+        waldo = model.createIfcWall(Name="Waldo")
+        specs.validate(model)
+
+        assert spec.applicable_entities == [waldo]
+        assert spec.requirements[0].failed_entities == [waldo]
+
+    def test_validating_with_the_entity_facet_after_other_applicability_facets(self):
+        specs = ids.Ids(title="Title")
+        spec = ids.Specification(name="Name")
+        spec.applicability.append(ids.Attribute(name="Name", value="Waldo"))
+        spec.applicability.append(ids.Entity(name="IFCWALL"))
+        spec.requirements.append(ids.Attribute(name="Description", value="Foobar"))
+        specs.specifications.append(spec)
+
+        model = ifcopenshell.file()
+        model.createIfcWall()
+        waldo = model.createIfcWall(Name="Waldo")
+        specs.validate(model)
+
+        assert spec.applicable_entities == [waldo]
+
+    def test_validating_twice_does_not_accumulate_results(self):
+        specs = ids.Ids(title="Title")
+        spec = ids.Specification(name="Name")
+        spec.applicability.append(ids.Entity(name="IFCWALL"))
+        spec.requirements.append(ids.Attribute(name="Name", value="Waldo"))
+        specs.specifications.append(spec)
+
+        model = ifcopenshell.file()
+        wall = model.createIfcWall()
+        specs.validate(model)
+        specs.validate(model)
+
+        assert spec.applicable_entities == [wall]
+        assert spec.requirements[0].failed_entities == [wall]
+        assert len(spec.requirements[0].failed_reasons) == 1
+
+    def test_specifications_for_other_ifc_versions_are_not_validated(self):
+        specs = ids.Ids(title="Title")
+        spec = ids.Specification(name="Name", ifcVersion=["IFC2X3"])
+        spec.applicability.append(ids.Entity(name="IFCWALL"))
+        spec.requirements.append(ids.Attribute(name="Name", value="Waldo"))
+        specs.specifications.append(spec)
+
+        model = ifcopenshell.file(schema="IFC4")
+        model.createIfcWall()
+        specs.validate(model)
+
+        assert spec.status is None
+        assert spec.applicable_entities == []
+
+        results = reporter.Json(specs).report()
+        assert results["specifications"][0]["status"] is None
+        assert results["specifications"][0]["total"] == 0
+
 
 class TestSpecification:
     def test_create_specification_with_minimal_information(self):
@@ -159,7 +255,7 @@ class TestSpecification:
             "@name": "name",
             "@minOccurs": "0",
             "@maxOccurs": "unbounded",
-            "@ifcVersion": "IFC4",
+            "@ifcVersion": ["IFC4"],
             "@identifier": "identifier",
             "@description": "description",
             "@instructions": "instructions",